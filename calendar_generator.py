@@ -2,8 +2,12 @@
 Calendar generator — adds parsed shift data directly to Google Calendar via the API.
 """
 
+import hashlib
+import uuid
 from datetime import datetime, date, time, timedelta
 
+from google_api import execute_batch
+
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
@@ -13,6 +17,9 @@ TIMEZONE = "Australia/Sydney"
 # Google Calendar colorId for "Flamingo" (reliably applied via the API)
 COLOR_ID = "4"
 
+# HTTP status for an insert whose event id already exists
+CONFLICT_STATUS = 409
+
 
 # ---------------------------------------------------------------------------
 # Public API
@@ -32,23 +39,41 @@ def add_to_calendar(service, shifts: list[dict]) -> list[str]:
     if not shifts:
         raise ValueError("No shifts to add — the parser returned an empty list.")
 
-    urls = []
-    for shift in shifts:
-        event_body = _make_event_body(shift)
-        result = service.events().insert(
-            calendarId="primary",
-            body=event_body,
-        ).execute()
-        urls.append(result.get("htmlLink", ""))
-
-    return urls
+    # Each body carries an id unique to this run and shift, so an insert replayed
+    # after a 5xx that the server had already applied gets a 409, not a duplicate.
+    # The random run key keeps ids from colliding with events from earlier runs
+    # (Calendar keeps the ids of deleted events) or with an identical shift.
+    run_key = uuid.uuid4().hex
+    bodies = [
+        _make_event_body(shift, _make_event_id(run_key, i))
+        for i, shift in enumerate(shifts)
+    ]
+
+    # Sent as batch HTTP requests; transient failures are retried per event
+    results = execute_batch(service, [
+        service.events().insert(calendarId="primary", body=body)
+        for body in bodies
+    ], accept_statuses=frozenset((CONFLICT_STATUS,)))
+
+    # A 409 can only come from this run's own replayed insert; look those up
+    # to report their URLs
+    existing = [i for i, result in enumerate(results) if result is None]
+    if existing:
+        found = execute_batch(service, [
+            service.events().get(calendarId="primary", eventId=bodies[i]["id"])
+            for i in existing
+        ])
+        for i, result in zip(existing, found):
+            results[i] = result
+
+    return [result.get("htmlLink", "") for result in results]
 
 
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
 
-def _make_event_body(shift: dict) -> dict:
+def _make_event_body(shift: dict, event_id: str) -> dict:
     """Build a Google Calendar API event dict from a single shift dict."""
     shift_date: date = shift["date"]
     start: time = shift["start"]
@@ -63,6 +88,7 @@ def _make_event_body(shift: dict) -> dict:
         dt_end += timedelta(days=1)
 
     return {
+        "id": event_id,
         "summary": title,
         "start": {
             "dateTime": dt_start.isoformat(),
@@ -74,3 +100,12 @@ def _make_event_body(shift: dict) -> dict:
         },
         "colorId": COLOR_ID,
     }
+
+
+def _make_event_id(run_key: str, index: int) -> str:
+    """Derive the Calendar event id for the shift at index within one run.
+
+    Calendar ids may only use base32hex characters (0-9, a-v); a hex digest is
+    a subset of those.
+    """
+    return hashlib.sha1(f"{run_key}|{index}".encode("utf-8")).hexdigest()
@@ -8,12 +8,15 @@ Setup:
 """
 
 import base64
+import functools
 import os
-from email import message_from_bytes
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
+import re
+from html.parser import HTMLParser
+
+from google_api import execute_batch, execute_with_retry
+
+# The Google client libraries are imported inside the functions that use them:
+# they take hundreds of milliseconds to load and most helpers here don't need them.
 
 SCOPES = [
         'https://www.googleapis.com/auth/gmail.readonly',
@@ -25,9 +28,16 @@ TOKEN_FILE = "token.json"
 # Edit this query to match your shift email's subject line
 DEFAULT_SEARCH_QUERY = "subject:New shifts assigned at House Made Hospitality"
 
+# Pulls the charset parameter out of a Content-Type header value
+CHARSET_RE = re.compile(r'charset\s*=\s*"?([^";\s]+)', re.IGNORECASE)
+
 
 def _get_credentials():
     """Get (and refresh/create) OAuth2 credentials covering all SCOPES."""
+    from google.auth.transport.requests import Request
+    from google.oauth2.credentials import Credentials
+    from google_auth_oauthlib.flow import InstalledAppFlow
+
     creds = None
 
     if os.path.exists(TOKEN_FILE):
@@ -54,38 +64,131 @@ def _get_credentials():
 
 def get_gmail_service():
     """Authenticate and return a Gmail API service object."""
-    return build("gmail", "v1", credentials=_get_credentials())
+    return _build_service("gmail", "v1")
 
 
 def get_calendar_service():
     """Authenticate and return a Google Calendar API service object."""
-    return build("calendar", "v3", credentials=_get_credentials())
+    return _build_service("calendar", "v3")
+
+
+def _build_service(api: str, version: str):
+    """Build a service from the discovery document bundled with googleapiclient.
+
+    static_discovery reads the document from the installed package instead of
+    fetching it over HTTPS on every start-up, so no discovery cache is needed.
+    """
+    from googleapiclient.discovery import build
+
+    return build(
+        api,
+        version,
+        http=_get_authorized_http(),
+        model=_get_json_model(),
+        static_discovery=True,
+        cache_discovery=False,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _get_authorized_http():
+    """Return one authorized HTTP client shared by every service.
+
+    Sharing it means credentials are loaded (and refreshed) once per run rather
+    than once per service. build_http() applies googleapiclient's own defaults:
+    socket.getdefaulttimeout() and no 308 redirect handling.
+    """
+    import google_auth_httplib2
+    from googleapiclient.http import build_http
+
+    return google_auth_httplib2.AuthorizedHttp(_get_credentials(), http=build_http())
+
+
+@functools.lru_cache(maxsize=None)
+def _get_json_model():
+    """Return a googleapiclient JsonModel that (de)serializes bodies with orjson.
+
+    Request bodies here are tiny; the gain is on responses, where a format=full
+    message carries its whole base64 body in the JSON and can run to hundreds
+    of KB. Falls back to the stock JsonModel when orjson is not installed.
+    """
+    from googleapiclient.model import JsonModel
+
+    try:
+        import orjson
+    except ImportError:
+        return JsonModel()
+
+    class _OrjsonModel(JsonModel):
+        def serialize(self, body_value):
+            # googleapiclient sets Content-Length from len(str), so non-ASCII
+            # bodies go to json.dumps, which escapes them; orjson writes raw UTF-8
+            if not _is_ascii(body_value):
+                return super().serialize(body_value)
+            if isinstance(body_value, dict) and "data" not in body_value and self._data_wrapper:
+                body_value = {"data": body_value}
+            return orjson.dumps(body_value).decode("ascii")
+
+        def deserialize(self, content):
+            try:
+                body = orjson.loads(content)
+            except orjson.JSONDecodeError:
+                # Same fallback as JsonModel: hand back the raw text
+                return content.decode("utf-8") if isinstance(content, bytes) else content
+            if self._data_wrapper and isinstance(body, dict) and "data" in body:
+                body = body["data"]
+            return body
+
+    return _OrjsonModel()
+
+
+def _is_ascii(value) -> bool:
+    """Return True if every string in a JSON-like value, keys included, is pure ASCII."""
+    if isinstance(value, str):
+        return value.isascii()
+    if isinstance(value, dict):
+        return all(_is_ascii(k) and _is_ascii(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return all(_is_ascii(v) for v in value)
+    return True
 
 
 def search_emails(service, query: str = DEFAULT_SEARCH_QUERY, max_results: int = 5) -> list[dict]:
     """Search Gmail and return a list of message summaries."""
-    result = service.users().messages().list(
+    return fetch_metadata(service, list_message_ids(service, query, max_results))
+
+
+def list_message_ids(service, query: str = DEFAULT_SEARCH_QUERY, max_results: int = 5) -> list[str]:
+    """Search Gmail and return the matching message IDs, without fetching any headers."""
+    result = execute_with_retry(service.users().messages().list(
         userId="me",
         q=query,
         maxResults=max_results
-    ).execute()
+    ))
+
+    return [msg["id"] for msg in result.get("messages", [])]
 
-    messages = result.get("messages", [])
-    if not messages:
+
+def fetch_metadata(service, message_ids: list[str]) -> list[dict]:
+    """Fetch the Subject/From/Date summary of each message ID, in the given order."""
+    if not message_ids:
         return []
 
-    summaries = []
-    for msg in messages:
-        meta = service.users().messages().get(
+    metas = execute_batch(service, [
+        service.users().messages().get(
             userId="me",
-            id=msg["id"],
+            id=message_id,
             format="metadata",
             metadataHeaders=["Subject", "From", "Date"]
-        ).execute()
+        )
+        for message_id in message_ids
+    ])
 
+    summaries = []
+    for message_id, meta in zip(message_ids, metas):
         headers = {h["name"]: h["value"] for h in meta["payload"]["headers"]}
         summaries.append({
-            "id": msg["id"],
+            "id": message_id,
             "subject": headers.get("Subject", "(no subject)"),
             "from": headers.get("From", ""),
             "date": headers.get("Date", ""),
@@ -96,59 +199,111 @@ def search_emails(service, query: str = DEFAULT_SEARCH_QUERY, max_results: int =
 
 def fetch_email_body(service, message_id: str) -> str:
     """Fetch and return the plain-text body of an email by ID."""
-    msg = service.users().messages().get(
+    msg = execute_with_retry(service.users().messages().get(
         userId="me",
         id=message_id,
-        format="raw"
-    ).execute()
-
-    raw = base64.urlsafe_b64decode(msg["raw"].encode("utf-8"))
-    email_msg = message_from_bytes(raw)
+        format="full"
+    ))
 
-    return _extract_plain_text(email_msg)
+    return _extract_plain_text(msg["payload"])
 
 
-def _extract_plain_text(msg) -> str:
-    """Extract readable text from an email, preferring text/plain over text/html."""
-    plain = None
-    html = None
+def _extract_plain_text(payload: dict) -> str:
+    """Extract readable text from a Gmail message payload, preferring text/plain over text/html."""
+    html_part = None
 
-    for part in msg.walk():
-        ct = part.get_content_type()
-        if ct == "text/plain" and plain is None:
-            charset = part.get_content_charset() or "utf-8"
-            plain = part.get_payload(decode=True).decode(charset, errors="replace")
-        elif ct == "text/html" and html is None:
-            charset = part.get_content_charset() or "utf-8"
-            html = part.get_payload(decode=True).decode(charset, errors="replace")
+    # Stop at the first non-empty text/plain part; only the first HTML part is
+    # remembered, and it is decoded only if no plain text turns up
+    for part in _walk_parts(payload):
+        ct = part.get("mimeType", "").lower()
+        if ct == "text/plain":
+            if plain := _decode_part_body(part):
+                return plain
+        elif ct == "text/html" and html_part is None:
+            html_part = part
 
-    if plain:
-        return plain
-    if html:
+    if html_part is not None and (html := _decode_part_body(html_part)):
         return _html_to_text(html)
     return ""
 
 
-def _html_to_text(html: str) -> str:
-    """Convert HTML to plain text by stripping tags and mapping block elements to newlines."""
-    from html.parser import HTMLParser
+def _walk_parts(part: dict):
+    """Yield a payload part and all of its sub-parts, depth first (like Message.walk())."""
+    yield part
+    for sub in part.get("parts", []):
+        yield from _walk_parts(sub)
+
 
-    class _Extractor(HTMLParser):
-        def __init__(self):
-            super().__init__()
-            self.parts = []
+def _decode_part_body(part: dict) -> str:
+    """Decode the base64url body of a single payload part using its declared charset."""
+    data = part.get("body", {}).get("data", "")
+    # Re-pad in case the API returns unpadded base64url
+    raw = base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+    return raw.decode(_part_charset(part), errors="replace")
 
-        def handle_data(self, data):
-            self.parts.append(data)
 
-        def handle_starttag(self, tag, attrs):
-            if tag in ("br", "p", "div", "tr", "li", "h1", "h2", "h3", "h4"):
-                self.parts.append("\n")
+def _part_charset(part: dict) -> str:
+    """Return the charset from a part's Content-Type header, defaulting to utf-8."""
+    for header in part.get("headers", []):
+        if header["name"].lower() == "content-type":
+            if m := CHARSET_RE.search(header["value"]):
+                return m.group(1)
+            break
+    return "utf-8"
 
-        def handle_endtag(self, tag):
-            if tag in ("p", "div", "tr", "li", "h1", "h2", "h3", "h4"):
-                self.parts.append("\n")
 
-    extractor = _Extractor()
-    extractor.feed(html)
-    return "".join(extractor.parts)
+def _html_to_text(html: str) -> str:
+    """Convert HTML to plain text by stripping tags and mapping block elements to newlines.
+
+    Uses selectolax's C parser when it is installed, otherwise the stdlib HTMLParser.
+    """
+    try:
+        from selectolax.lexbor import LexborHTMLParser
+    except ImportError:
+        extractor = _TextExtractor()
+        extractor.feed(html)
+        extractor.close()
+        return "".join(extractor.parts)
+
+    parts = []
+    root = LexborHTMLParser(html).root
+    if root is not None:
+        _collect_text(root, parts)
+    return "".join(parts)
+
+
+def _collect_text(node, parts: list[str]) -> None:
+    """Append the text under a selectolax node, emitting newlines around block-level elements."""
+    for child in node.iter(include_text=True):
+        if child.tag == "-text":
+            parts.append(child.text_content)
+            continue
+        if child.tag in _BLOCK_START_TAGS:
+            parts.append("\n")
+        _collect_text(child, parts)
+        if child.tag in _BLOCK_END_TAGS:
+            parts.append("\n")
+
+
+# Tags that start a new line when opened ("br" has no end tag)
+_BLOCK_START_TAGS = frozenset(("br", "p", "div", "tr", "li", "h1", "h2", "h3", "h4"))
+_BLOCK_END_TAGS = _BLOCK_START_TAGS - {"br"}
+
+
+class _TextExtractor(HTMLParser):
+    """Collect text nodes, emitting newlines around block-level elements."""
+
+    def __init__(self):
+        super().__init__()
+        self.parts = []
+
+    def handle_data(self, data):
+        self.parts.append(data)
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _BLOCK_START_TAGS:
+            self.parts.append("\n")
+
+    def handle_endtag(self, tag):
+        if tag in _BLOCK_END_TAGS:
+            self.parts.append("\n")
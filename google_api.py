@@ -0,0 +1,120 @@
+"""
+Google API helpers — batching and retrying requests for the Gmail and Calendar services.
+"""
+
+import json
+import random
+import time
+
+# Maximum number of calls Google accepts in a single batch HTTP request
+BATCH_LIMIT = 50
+
+# Rate-limit and transient server errors worth retrying, with truncated
+# exponential backoff: sleep min(2^n + jitter, MAX_BACKOFF) seconds.
+# Gmail and Calendar report per-user rate limits as 403 with one of these reasons.
+RETRYABLE_STATUSES = frozenset((429, 500, 502, 503, 504))
+RATE_LIMIT_REASONS = frozenset(("rateLimitExceeded", "userRateLimitExceeded"))
+MAX_TRIES = 6
+MAX_BACKOFF = 32
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+def execute_with_retry(request):
+    """
+    Execute a single API request, retrying rate-limit and transient server errors.
+
+    googleapiclient's num_retries already backs off with jitter on 5xx, 429
+    and 403 rate-limit responses.
+    """
+    return request.execute(num_retries=MAX_TRIES - 1)
+
+
+def execute_batch(service, requests: list, accept_statuses: frozenset = frozenset()) -> list:
+    """
+    Execute API requests as batch HTTP calls of up to BATCH_LIMIT each.
+
+    Requests that fail with a retryable status are re-sent in a fresh batch
+    after a backoff. A 5xx can arrive after the server has already applied a
+    call, so requests that create resources must be idempotent (e.g. carry a
+    client-chosen id) for the retry to be safe.
+
+    Args:
+        service:         Google API service object the requests belong to.
+        requests:        HttpRequest objects to execute.
+        accept_statuses: HTTP error statuses to treat as success, such as 409
+                         for an insert replayed with the same id.
+
+    Returns:
+        The responses, in the same order as requests. A request that failed
+        with an accepted status has None in its place.
+    """
+    responses = [None] * len(requests)
+    failed = {}
+
+    def _on_response(request_id, response, exception):
+        if exception is None:
+            responses[int(request_id)] = response
+        elif exception.resp.status not in accept_statuses:
+            failed[int(request_id)] = exception
+
+    pending = list(range(len(requests)))
+    for attempt in range(MAX_TRIES):
+        failed.clear()
+        for offset in range(0, len(pending), BATCH_LIMIT):
+            batch = service.new_batch_http_request(callback=_on_response)
+            for i in pending[offset:offset + BATCH_LIMIT]:
+                batch.add(requests[i], request_id=str(i))
+            _execute_batch_request(batch)
+
+        if not failed:
+            return responses
+        for exc in failed.values():
+            if not _is_retryable(exc) or attempt == MAX_TRIES - 1:
+                raise exc
+
+        pending = sorted(failed)
+        _backoff(attempt)
+
+
+# ---------------------------------------------------------------------------
+# Internal helpers
+# ---------------------------------------------------------------------------
+
+def _execute_batch_request(batch) -> None:
+    """Execute one batch HTTP request, retrying if the whole batch call fails.
+
+    BatchHttpRequest.execute() takes no num_retries, so the backoff is done here.
+    """
+    from googleapiclient.errors import HttpError
+
+    for attempt in range(MAX_TRIES):
+        try:
+            return batch.execute()
+        except HttpError as e:
+            if not _is_retryable(e) or attempt == MAX_TRIES - 1:
+                raise
+            _backoff(attempt)
+
+
+def _is_retryable(exc) -> bool:
+    """Return True if the HttpError is a rate limit or transient server failure."""
+    status = exc.resp.status
+    if status == 403:
+        return _error_reason(exc) in RATE_LIMIT_REASONS
+    return status in RETRYABLE_STATUSES
+
+
+def _error_reason(exc) -> str:
+    """Return the first error reason from an HttpError's JSON body, or "" if there is none."""
+    try:
+        return json.loads(exc.content)["error"]["errors"][0]["reason"]
+    except (ValueError, KeyError, IndexError, TypeError):
+        return ""
+
+
+def _backoff(attempt: int) -> None:
+    """Sleep for the truncated exponential backoff delay of the given attempt."""
+    time.sleep(min(2 ** attempt + random.random(), MAX_BACKOFF))
@@ -87,45 +87,50 @@ def _read_file(path: str) -> str:
 
 
 def _fetch_from_gmail(query: str | None) -> str:
-    try:
-        from gmail_client import get_gmail_service, search_emails, fetch_email_body, DEFAULT_SEARCH_QUERY
-    except ImportError as e:
-        print(f"Error importing Gmail client: {e}")
-        sys.exit(1)
+    from gmail_client import (
+        get_gmail_service, list_message_ids, fetch_metadata, fetch_email_body, DEFAULT_SEARCH_QUERY,
+    )
 
     search_query = query or DEFAULT_SEARCH_QUERY
 
     print("Connecting to Gmail...")
-    service = get_gmail_service()
+    try:
+        service = get_gmail_service()
+    except ImportError as e:
+        # The Google client libraries are only imported once a service is built
+        print(f"Error importing Gmail client: {e}")
+        sys.exit(1)
 
     print(f"Searching for emails matching: {search_query!r}")
-    emails = search_emails(service, query=search_query)
+    message_ids = list_message_ids(service, query=search_query)
 
-    if not emails:
+    if not message_ids:
         print(f"No emails found matching the query: {search_query!r}")
         print("Try adjusting the query with --query, e.g.: --query 'subject:your shift'")
         sys.exit(1)
 
+    # A single match needs no selection menu, so skip fetching its headers
+    if len(message_ids) == 1:
+        print("\nFound 1 email — using the only result.")
+        return fetch_email_body(service, message_ids[0])
+
     # Let the user pick an email
+    emails = fetch_metadata(service, message_ids)
     print(f"\nFound {len(emails)} email(s):\n")
     for i, email in enumerate(emails, start=1):
         print(f"  [{i}] {email['date']}")
         print(f"      From: {email['from']}")
         print(f"      Subject: {email['subject']}\n")
 
-    if len(emails) == 1:
-        choice = 1
-        print(f"Using the only result: [{choice}]")
-    else:
-        while True:
-            raw = input(f"Select an email [1-{len(emails)}] (default: 1): ").strip()
-            if raw == "":
-                choice = 1
-                break
-            if raw.isdigit() and 1 <= int(raw) <= len(emails):
-                choice = int(raw)
-                break
-            print(f"Please enter a number between 1 and {len(emails)}.")
+    while True:
+        raw = input(f"Select an email [1-{len(emails)}] (default: 1): ").strip()
+        if raw == "":
+            choice = 1
+            break
+        if raw.isdigit() and 1 <= int(raw) <= len(emails):
+            choice = int(raw)
+            break
+        print(f"Please enter a number between 1 and {len(emails)}.")
 
     selected = emails[choice - 1]
     print(f"\nFetching email: {selected['subject']!r}")
@@ -13,31 +13,33 @@ Returns a list of dicts:
   {"date": datetime.date, "start": datetime.time, "end": datetime.time, "title": str}
 """
 
+import functools
 import re
-from datetime import date, time, datetime
+from datetime import date, time
 
 # ---------------------------------------------------------------------------
 # Patterns tuned to the Employment Hero email format
 # ---------------------------------------------------------------------------
 
-# Marks the start of a new shift block: "1. Work Site: ..."
-SHIFT_BLOCK_RE = re.compile(r"^\d+\.\s+Work Site:", re.IGNORECASE | re.MULTILINE)
-
-# "Date: DD/MM/YYYY"
-DATE_LINE_RE = re.compile(r"^Date:\s*(\d{2}/\d{2}/\d{4})", re.IGNORECASE)
-
-# "Time: 03:00 PM - 11:00 PM"
-TIME_LINE_RE = re.compile(
-    r"^Time:\s*(\d{1,2}:\d{2})\s*(AM|PM)\s*-\s*(\d{1,2}:\d{2})\s*(AM|PM)",
-    re.IGNORECASE,
+# Marks the start of a new shift block: "1. Work Site: ..." (matches the "1. " only)
+SHIFT_BLOCK_RE = re.compile(r"^\d+\.\s+(?=Work Site:)", re.IGNORECASE | re.MULTILINE)
+
+# One line of a shift block, captured into named groups:
+#   "Work Site: (CAR) Carrington FOH"
+#   "Position: Bartender"
+#   "Date: DD/MM/YYYY"
+#   "Time: 03:00 PM - 11:00 PM"
+SHIFT_FIELD_RE = re.compile(
+    r"^[^\S\n]*(?:"
+    r"Work Site:[^\S\n]*(?P<site>.+)"
+    r"|Position:[^\S\n]*(?P<position>.+)"
+    r"|Date:[^\S\n]*(?P<date>\d{2}/\d{2}/\d{4})"
+    r"|Time:[^\S\n]*(?P<start>\d{1,2}:\d{2})[^\S\n]*(?P<start_ampm>AM|PM)[^\S\n]*-[^\S\n]*"
+    r"(?P<end>\d{1,2}:\d{2})[^\S\n]*(?P<end_ampm>AM|PM)"
+    r")",
+    re.IGNORECASE | re.MULTILINE,
 )
 
-# "Position: Bartender"
-POSITION_RE = re.compile(r"^Position:\s*(.+)", re.IGNORECASE)
-
-# "Work Site: (CAR) Carrington FOH"
-WORK_SITE_RE = re.compile(r"^Work Site:\s*(.+)", re.IGNORECASE)
-
 
 # ---------------------------------------------------------------------------
 # Public API
@@ -57,13 +59,13 @@ def parse_shifts(body: str) -> list[dict]:
     """
     shifts = []
 
-    # Split body on each numbered shift header ("1. Work Site:", "2. Work Site:", ...)
-    # The split consumes the delimiter, so re-attach "Work Site:" to each block.
-    blocks = SHIFT_BLOCK_RE.split(body)
-    shift_blocks = blocks[1:]  # blocks[0] is the preamble — discard it
+    # Slice body between numbered shift headers ("1. Work Site:", "2. Work Site:", ...).
+    # Each block starts at its "Work Site:" line; the preamble before the first is skipped.
+    headers = list(SHIFT_BLOCK_RE.finditer(body))
+    ends = [m.start() for m in headers[1:]] + [len(body)]
 
-    for block in shift_blocks:
-        shift = _parse_block("Work Site:" + block)
+    for header, end in zip(headers, ends):
+        shift = _parse_block(body[header.end():end])
         if shift:
             shifts.append(shift)
 
@@ -85,20 +87,17 @@ def _parse_block(block: str) -> dict | None:
     position = None
     work_site = None
 
-    for line in block.splitlines():
-        line = line.strip()
-        if not line:
-            continue
-
-        if m := WORK_SITE_RE.match(line):
-            work_site = m.group(1).strip()
-        elif m := POSITION_RE.match(line):
-            position = m.group(1).strip()
-        elif m := DATE_LINE_RE.match(line):
-            shift_date = _parse_date(m.group(1))
-        elif m := TIME_LINE_RE.match(line):
-            start_time = _parse_time(m.group(1), m.group(2))
-            end_time = _parse_time(m.group(3), m.group(4))
+    # Single pass over the block; a later line overrides an earlier one
+    for m in SHIFT_FIELD_RE.finditer(block):
+        if m["site"] is not None:
+            work_site = m["site"].strip()
+        elif m["position"] is not None:
+            position = m["position"].strip()
+        elif m["date"] is not None:
+            shift_date = _parse_date(m["date"])
+        else:
+            start_time = _parse_time(m["start"], m["start_ampm"])
+            end_time = _parse_time(m["end"], m["end_ampm"])
 
     if shift_date is None or start_time is None or end_time is None:
         return None
@@ -110,17 +109,26 @@ def _parse_block(block: str) -> dict | None:
     return {"date": shift_date, "start": start_time, "end": end_time, "title": title}
 
 
+@functools.lru_cache(maxsize=512)
 def _parse_date(date_str: str) -> date | None:
     """Parse DD/MM/YYYY into a date object."""
     try:
-        return datetime.strptime(date_str, "%d/%m/%Y").date()
+        day, month, year = date_str.split("/")
+        return date(int(year), int(month), int(day))
     except ValueError:
         return None
 
 
+@functools.lru_cache(maxsize=512)
 def _parse_time(time_str: str, ampm: str) -> time | None:
     """Parse 'HH:MM' + 'AM'/'PM' into a time object."""
     try:
-        return datetime.strptime(f"{time_str} {ampm.upper()}", "%I:%M %p").time()
+        hour, minute = (int(part) for part in time_str.split(":"))
+        if not 1 <= hour <= 12:
+            return None
+        hour %= 12
+        if ampm.upper() == "PM":
+            hour += 12
+        return time(hour, minute)
     except ValueError:
         return None